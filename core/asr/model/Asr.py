@@ -92,6 +92,7 @@ class Asr(ProjectAliceObject):
 
 	def decodeStream(self, session: DialogSession):
 		self._timeout.clear()
+		self._previousPartialRecord = ''
 		self._timeoutTimer = self.ThreadManager.newTimer(interval=int(self.ConfigManager.getAliceConfigByName('asrTimeout')), func=self.timeout)
 
 
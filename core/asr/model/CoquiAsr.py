@@ -42,6 +42,32 @@ class CoquiAsr(Asr):
 			'stt-tflite'
 		}
 	}
+	LANGUAGE_MODELS = {
+		'de': (
+			'https://github.com/coqui-ai/STT-models/releases/download/german/AASHISHAG/v0.9.0/model.tflite',
+			'https://github.com/philipp2310/Coqui-models/releases/download/de_v093/lm.scorer'
+		),
+		'en': (
+			'https://github.com/coqui-ai/STT-models/releases/download/english%2Fcoqui%2Fv1.0.0-large-vocab/model.tflite',
+			'https://github.com/coqui-ai/STT-models/releases/download/english%2Fcoqui%2Fv1.0.0-large-vocab/large_vocabulary.scorer'
+		),
+		'fr': (
+			'https://github.com/coqui-ai/STT-models/releases/download/french/commonvoice-fr/v0.6/model.tflite',
+			'https://github.com/coqui-ai/STT-models/releases/download/french/commonvoice-fr/v0.6/fr-cvfr-2-prune-kenlm.scorer'
+		),
+		'it': (
+			'https://github.com/coqui-ai/STT-models/releases/download/italian/mozillaitalia/2020.8.7/model.tflite',
+			'https://github.com/coqui-ai/STT-models/releases/download/italian/mozillaitalia/2020.8.7/it-mzit-1-prune-kenlm.scorer'
+		),
+		'pl': (
+			'https://github.com/coqui-ai/STT-models/releases/download/polish/jaco-assistant/v0.0.1/model.tflite',
+			'https://github.com/coqui-ai/STT-models/releases/download/polish/jaco-assistant/v0.0.1/kenlm_pl.scorer'
+		),
+		'pt': (
+			'https://github.com/coqui-ai/STT-models/releases/download/portuguese/itml/v0.1.0/model.tflite',
+			'https://github.com/coqui-ai/STT-models/releases/download/portuguese/itml/v0.1.0/pt-itml-0-prune-kenlm.scorer'
+		)
+	}
 
 
 	def __init__(self):
@@ -92,39 +118,19 @@ class CoquiAsr(Asr):
 		return self._langPath / 'output_graph.tflite'
 
 
-	# noinspection DuplicatedCode
-	def downloadLanguage(self) -> bool:  # NOSONAR
+	def downloadLanguage(self) -> bool:
 		self.logInfo(f'Downloading language model for "{self.LanguageManager.activeLanguage}", hold on, this is going to take some time!')
 		# TODO TEMP! until real model zoo exists
-		target = str(self._langPath / 'lm.scorer')
-		if self.LanguageManager.activeLanguage == 'de':
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/german/AASHISHAG/v0.9.0/model.tflite', str(self.tFlite))
-			self.Commons.downloadFile('https://github.com/philipp2310/Coqui-models/releases/download/de_v093/lm.scorer', target)
-			return True
-		elif self.LanguageManager.activeLanguage == 'en':
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/english%2Fcoqui%2Fv1.0.0-large-vocab/model.tflite', str(self.tFlite))
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/english%2Fcoqui%2Fv1.0.0-large-vocab/large_vocabulary.scorer', target)
-			return True
-		elif self.LanguageManager.activeLanguage == 'fr':
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/french/commonvoice-fr/v0.6/model.tflite', str(self.tFlite))
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/french/commonvoice-fr/v0.6/fr-cvfr-2-prune-kenlm.scorer', target)
-			return True
-		elif self.LanguageManager.activeLanguage == 'it':
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/italian/mozillaitalia/2020.8.7/model.tflite', str(self.tFlite))
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/italian/mozillaitalia/2020.8.7/it-mzit-1-prune-kenlm.scorer', target)
-			return True
-		elif self.LanguageManager.activeLanguage == 'pl':
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/polish/jaco-assistant/v0.0.1/model.tflite', str(self.tFlite))
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/polish/jaco-assistant/v0.0.1/kenlm_pl.scorer', target)
-			return True
-		elif self.LanguageManager.activeLanguage == 'pt':
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/portuguese/itml/v0.1.0/model.tflite', str(self.tFlite))
-			self.Commons.downloadFile('https://github.com/coqui-ai/STT-models/releases/download/portuguese/itml/v0.1.0/pt-itml-0-prune-kenlm.scorer', target)
-			return True
-		else:
+		urls = self.LANGUAGE_MODELS.get(self.LanguageManager.activeLanguage)
+		if not urls:
 			self.logError('WIP! Only de/en supported for now - Please install language manually into PA/trained/asr/Coqui/<language>/!')
 			return False
 
+		modelUrl, scorerUrl = urls
+		self.Commons.downloadFile(modelUrl, str(self.tFlite))
+		self.Commons.downloadFile(scorerUrl, str(self._langPath / 'lm.scorer'))
+		return True
+
 
 	def onVadUp(self):
 		self._triggerFlag.set()
@@ -139,21 +145,33 @@ class CoquiAsr(Asr):
 
 	def decodeStream(self, session: DialogSession) -> Optional[ASRResult]:
 		super().decodeStream(session)
-		result = None
+		decodeInterval = max(1, int(self.ConfigManager.getAliceConfigByName('asrPartialDecodeInterval') or 4))
+		fedChunks = 0
 
 		with Stopwatch() as processingTime:
 			with Recorder(self._timeout, session.user, session.deviceUid) as recorder:
 				self.ASRManager.addRecorder(session.deviceUid, recorder)
 				self._recorder = recorder
 				streamContext = self._model.createStream()
+
+				# Bind what the loop calls to locals, this runs for every audio chunk
+				feed = streamContext.feedAudioContent
+				decode = streamContext.intermediateDecode
+				emit = self.partialTextCaptured
+
 				for chunk in recorder:
 					if not chunk:
 						break
 
-					streamContext.feedAudioContent(np.frombuffer(chunk, np.int16))
+					feed(np.frombuffer(chunk, np.int16))
+					fedChunks += 1
+
+					# Audio keeps being captured while we decode. Catch up on the backlog first, partials can wait
+					if recorder.pendingChunks or fedChunks < decodeInterval:
+						continue
 
-					result = streamContext.intermediateDecode()
-					self.partialTextCaptured(session=session, text=result, likelihood=1, seconds=0)
+					fedChunks = 0
+					emit(session=session, text=decode(), likelihood=1, seconds=0)
 
 			text = streamContext.finishStream()
 			self._triggerFlag.clear()
@@ -164,7 +182,7 @@ class CoquiAsr(Asr):
 			session=session,
 			likelihood=1.0,
 			processingTime=processingTime.time
-		) if result else None
+		) if text else None
 
 
 	# noinspection DuplicatedCode
@@ -54,6 +54,11 @@ class Recorder(ProjectAliceObject):
 		return self._recording
 
 
+	@property
+	def pendingChunks(self) -> int:
+		return self._buffer.qsize()
+
+
 	def onSessionError(self, session: DialogSession):
 		self.stopRecording()
 
@@ -18,7 +18,6 @@
 #  Last modified: 2021.05.19 at 12:56:45 CEST
 
 import threading
-import time
 from typing import Optional
 
 from core.asr.model.Asr import Asr
@@ -46,9 +45,9 @@ class SnipsAsr(Asr):
 		super().__init__()
 		self._capableOfArbitraryCapture = True
 		self._isOnlineASR = False
-		self._listening = False
 		self._thread: Optional[threading.Thread] = None
 		self._flag = threading.Event()
+		self._flag.set()
 
 
 	def installDependencies(self):
@@ -58,16 +57,15 @@ class SnipsAsr(Asr):
 
 
 	def onStartListening(self, session):
-		self._listening = True
+		self._flag.clear()
 
 
 	def onAsrToggleOff(self, deviceUid: str):
-		self._listening = False
+		self._flag.set()
 
 
 	def decodeStream(self, session: DialogSession):
-		while self._listening:
-			time.sleep(0.1)
+		self._flag.wait()
 
 
 	def onStart(self):
@@ -76,21 +74,27 @@ class SnipsAsr(Asr):
 		if self.LanguageManager.activeLanguage != 'en':
 			raise Exception('Snips generic ASR only for english')
 
-		# noinspection DuplicatedCode
-		cmd = f'snips-asr --assistant {self.Commons.rootDir()}/assistant --mqtt {self.ConfigManager.getAliceConfigByName("mqttHost")}:{self.ConfigManager.getAliceConfigByName("mqttPort")}'
+		keys = ('mqttHost', 'mqttPort', 'mqttUser', 'mqttPassword', 'mqttTLSFile')
+		configs = {key: self.ConfigManager.getAliceConfigByName(key) for key in keys}
 
-		if self.ConfigManager.getAliceConfigByName('mqttUser'):
-			cmd += f' --mqtt-username {self.ConfigManager.getAliceConfigByName("mqttUser")} --mqtt-password {self.ConfigManager.getAliceConfigByName("mqttPassword")}'
+		cmd = [
+			'snips-asr',
+			'--assistant', f'{self.Commons.rootDir()}/assistant',
+			'--mqtt', f'{configs["mqttHost"]}:{configs["mqttPort"]}'
+		]
 
-		if self.ConfigManager.getAliceConfigByName('mqttTLSFile'):
-			cmd += f' --mqtt-tls-cafile {self.ConfigManager.getAliceConfigByName("mqttTLSFile")}'
+		if configs['mqttUser']:
+			cmd.extend(['--mqtt-username', configs['mqttUser'], '--mqtt-password', configs['mqttPassword']])
 
-		cmd += ' --model /usr/share/snips/snips-asr-model-en-500MB'
-		cmd += ' --partial'
+		if configs['mqttTLSFile']:
+			cmd.extend(['--mqtt-tls-cafile', configs['mqttTLSFile']])
+
+		cmd.extend(['--model', '/usr/share/snips/snips-asr-model-en-500MB', '--partial'])
 
 		self.SubprocessManager.runSubprocess(name='SnipsASR', cmd=cmd, autoRestart=True)
 
 
 	def onStop(self):
 		super().onStop()
+		self._flag.set()
 		self.SubprocessManager.terminateSubprocess(name='SnipsASR')
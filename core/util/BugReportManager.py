@@ -16,13 +16,17 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>
 #
 #  Last modified: 2021.04.24 at 12:56:47 CEST
-import json
+import contextlib
+import itertools
 import os
 import requests
 import subprocess
+import sys
 import traceback
 from AliceGit.Git import Repository
+from collections import deque
 from pathlib import Path
+from typing import Generator, Iterable, List
 
 from core.base.model.Manager import Manager
 from core.commons import constants
@@ -30,11 +34,15 @@ from core.commons import constants
 
 class BugReportManager(Manager):
 
-	ERROR_LOGS = [
+	ERROR_LOGS = frozenset({
 		'fatal',
 		'error',
 		'critical'
-	]
+	})
+
+	MAX_BODY_LENGTH = 60000
+	ERROR_CONTEXT_LINES = 100
+	HISTORY_TAIL_LENGTH = 10000
 
 	def __init__(self):
 		super().__init__(name='BugReportManager')
@@ -43,13 +51,21 @@ class BugReportManager(Manager):
 		if self._flagFile.exists():
 			self._recording = True
 			self.logInfo('Flag file detected, recording errors for this run')
-			version = subprocess.run('git rev-parse HEAD', capture_output=True, text=True, shell=True).stdout.strip()
+			try:
+				version = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=False).stdout.strip()
+			except OSError:
+				version = 'unknown'
 			self.logInfo('Project Alice logs')
 			self.logInfo(f'Git commit id: {version}')
 		else:
 			self._recording = False
-		self._history = list()
+		# Everything up to shortly after the first error is kept, only what follows is capped
+		self._history: List[str] = list()
+		self._historyEnd = 0
+		self._tail = deque(maxlen=self.HISTORY_TAIL_LENGTH)
+		self._droppedLines = 0
 		self._title = ''
+		self._session = requests.Session()
 
 
 	@property
@@ -61,10 +77,19 @@ class BugReportManager(Manager):
 		if not self._recording:
 			return
 
+		if self._title and len(self._history) >= self._historyEnd:
+			if len(self._tail) == self._tail.maxlen:
+				self._droppedLines += 1
+			self._tail.append(log)
+			return
+
 		self._history.append(log)
 
-		if function in self.ERROR_LOGS and not self._title and traceback.format_exc().strip() != 'NoneType: None':
-			self._title = traceback.format_exc().strip().split('\n').pop()
+		if self._title or function not in self.ERROR_LOGS or sys.exc_info()[0] is None:
+			return
+
+		self._title = traceback.format_exc().strip().rsplit('\n', 1)[-1]
+		self._historyEnd = len(self._history) + self.ERROR_CONTEXT_LINES
 
 
 	def onStop(self):
@@ -73,37 +98,87 @@ class BugReportManager(Manager):
 			return
 
 		try:
-			online = requests.get('https://api.projectalice.io/generate_204').status_code == 204
+			self._sendReport()
+		finally:
+			with contextlib.suppress(FileNotFoundError):
+				os.unlink(self._flagFile)
+			self._session.close()
+
+
+	def _sendReport(self):
+		# Local checks first, no need to go online or check for updates if there is nothing to send
+		if not self._history or not self._title:
+			self.logInfo('Nothing to report')
+			return
+
+		if not self.ConfigManager.githubAuth:
+			self.logWarning('Cannot report bugs if Github user and token are not set in configs')
+			return
+
+		try:
+			online = self._session.get('https://api.projectalice.io/generate_204', timeout=5).status_code == 204
 		except:
 			online = False
 
 		if not online:
 			self.logInfo('We are currently offline, cannot send log reports')
-			os.remove(self._flagFile)
 			return
 
 		repo = Repository(directory=self.Commons.rootDir())
 		if not repo.isUpToDate():
 			self.logInfo('Alice is not up to date. Please first update to latest version and retry before trying to submit a bug report again.')
-			os.remove(self._flagFile)
 			return
 
-		if not self._history or not self._title:
-			self.logInfo('Nothing to report')
-		elif not self.ConfigManager.githubAuth:
-			self.logWarning('Cannot report bugs if Github user and token are not set in configs')
+		title = f'[AUTO BUG REPORT] {self._title}'
+		# Github caps the issue body length, whatever doesn't fit goes into follow up comments
+		body, *followUps = self.splitHistory(self.reportLines(), self.MAX_BODY_LENGTH)
+		data = {
+			'title': title,
+			'body': f'```\n{body}\n```'
+		}
+
+		request = self._session.post(url=f'{constants.GITHUB_API_URL}/ProjectAlice/issues', json=data, auth=self.ConfigManager.githubAuth, timeout=10)
+		if request.status_code != 201:
+			self.logError(f'Something went wrong reporting a bug, status: {request.status_code}, error: {request.json()}')
 		else:
-			title = f'[AUTO BUG REPORT] {self._title}'
-			body = '\n'.join(self._history)
-			data = {
-				'title': title,
-				'body': f'```\n{body}\n```'
-			}
-
-			request = requests.post(url=f'{constants.GITHUB_API_URL}/ProjectAlice/issues', data=json.dumps(data), auth=self.ConfigManager.githubAuth)
-			if request.status_code != 201:
-				self.logError(f'Something went wrong reporting a bug, status: {request.status_code}, error: {request.json()}')
-			else:
-				self.logInfo(f'Created new issue: {request.json()["html_url"]}')
-
-		os.remove(self._flagFile)
+			issue = request.json()
+			for followUp in followUps:
+				request = self._session.post(url=f'{constants.GITHUB_API_URL}/ProjectAlice/issues/{issue["number"]}/comments', json={'body': f'```\n{followUp}\n```'}, auth=self.ConfigManager.githubAuth, timeout=10)
+				if request.status_code != 201:
+					self.logError(f'Something went wrong adding logs to the bug report, status: {request.status_code}, error: {request.json()}')
+					break
+
+			self.logInfo(f'Created new issue: {issue["html_url"]}')
+
+
+	def reportLines(self) -> Iterable[str]:
+		"""
+		The recorded history, from the start of the run to shortly after the first error, followed by the latest lines
+		:return: iterable of log lines
+		"""
+		dropped = [f'[...] {self._droppedLines} lines dropped'] if self._droppedLines else list()
+		return itertools.chain(self._history, dropped, self._tail)
+
+
+	@staticmethod
+	def splitHistory(history: Iterable[str], maxLength: int) -> Generator[str, None, None]:
+		"""
+		Joins the history lines into texts of at most maxLength characters, without splitting lines
+		Lines longer than maxLength are cut
+		:param history: the log lines
+		:param maxLength: maximum length of a text
+		:return: generator of texts
+		"""
+		lines = list()
+		length = 0
+		for line in history:
+			line = line[:maxLength]
+			if lines and length + len(line) > maxLength:
+				yield '\n'.join(lines)
+				lines = list()
+				length = 0
+
+			lines.append(line)
+			length += len(line) + 1
+
+		yield '\n'.join(lines)
@@ -20,7 +20,7 @@
 import sqlite3
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.ProjectAliceExceptions import DbConnectionError, InvalidQuery
 from core.base.model.Manager import Manager
@@ -31,11 +31,13 @@ from core.commons.CommonsManager import CommonsManager
 # noinspection SqlResolve
 class DatabaseManager(Manager):
 	TABLE_TAG = ':__table__'
+	QUERY_CACHE_SIZE = 512
 
 
 	def __init__(self):
 		super().__init__()
 		self._tables = list()
+		self._resolvedQueries: Dict[Tuple[str, str, str], str] = dict()
 
 
 	def onStart(self):
@@ -433,14 +435,25 @@ class DatabaseManager(Manager):
 
 
 	def basicChecks(self, tableName: str, query: str, callerName: str, values: dict = None) -> Optional[str]:
-		if self.TABLE_TAG not in query:
-			self.logWarning(f'The query must use \':__table__\' for the table name. Caller: {callerName}')
-			return None
-		elif tableName.startswith('sqlite_'):
-			self.logWarning(f'You cannot access system tables. Caller; {callerName}')
-			return None
-		elif values and self.TABLE_TAG in values:
+		# Callers mostly reuse the same few queries, only resolve and check them once
+		key = (tableName, callerName, query)
+		resolved = self._resolvedQueries.get(key)
+
+		if not resolved:
+			if self.TABLE_TAG not in query:
+				self.logWarning(f'The query must use \':__table__\' for the table name. Caller: {callerName}')
+				return None
+			elif tableName.startswith('sqlite_'):
+				self.logWarning(f'You cannot access system tables. Caller; {callerName}')
+				return None
+
+			resolved = query.replace(self.TABLE_TAG, callerName + '_' + tableName)
+			if len(self._resolvedQueries) >= self.QUERY_CACHE_SIZE:
+				self._resolvedQueries.clear()
+			self._resolvedQueries[key] = resolved
+
+		if values and self.TABLE_TAG in values:
 			self.logWarning(f"Cannot use reserved sqlite keyword \":__table__\". Caller: {callerName}")
 			return None
-		else:
-			return query.replace(self.TABLE_TAG, callerName + '_' + tableName)
+
+		return resolved
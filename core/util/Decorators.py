@@ -36,23 +36,37 @@ def deprecated(func):
 	https://stackoverflow.com/questions/2536307/decorators-in-the-python-standard-lib-deprecated-specifically
 	This is a decorator which can be used to mark functions
 	as deprecated. It will result in a warning being emitted
-	when the function is used.
+	the first time the function is used.
 	"""
 
 
+	warned = False
+
+
 	@functools.wraps(func)
 	def wrapper(*args, **kwargs):
-		warnings.simplefilter('always', DeprecationWarning)  # turn off filter
-		warnings.warn(f'Call to deprecated function {func.__name__}.',
-		              category=DeprecationWarning,
-		              stacklevel=2)
-		warnings.simplefilter('default', DeprecationWarning)  # reset filter
+		nonlocal warned
+		# Only warn on first use, the filters are global state and should not be touched on every call
+		if not warned:
+			warned = True
+			with warnings.catch_warnings():
+				warnings.simplefilter('always', DeprecationWarning)  # turn off filter
+				warnings.warn(f'Call to deprecated function {func.__name__}.',
+				              category=DeprecationWarning,
+				              stacklevel=2)
 		return func(*args, **kwargs)
 
 
 	return wrapper
 
 
+def _storeIntent(func: Callable, intent: Intent, requiredState: Optional[str]) -> Callable:
+	# store the intent in the function
+	func.intents = getattr(func, 'intents', list())
+	func.intents.append({'intent': intent, 'requiredState': requiredState})
+	return func
+
+
 def IntentHandler(intent: Union[str, Intent], requiredState: str = None, authLevel: AccessLevel = AccessLevel.ZERO, userIntent: bool = True):  # NOSONAR
 	"""Decorator for adding a method as an intent handler."""
 	if isinstance(intent, str):
@@ -60,11 +74,7 @@ def IntentHandler(intent: Union[str, Intent], requiredState: str = None, authLev
 
 
 	def wrapper(func):
-		# store the intent in the function
-		if not hasattr(func, 'intents'):
-			func.intents = []
-		func.intents.append({'intent': intent, 'requiredState': requiredState})
-		return func
+		return _storeIntent(func, intent, requiredState)
 
 
 	return wrapper
@@ -77,11 +87,7 @@ def MqttHandler(intent: Union[str, Intent], requiredState: str = None, authLevel
 
 
 	def wrapper(func):
-		# store the intent in the function
-		if not hasattr(func, 'intents'):
-			func.intents = []
-		func.intents.append({'intent': intent, 'requiredState': requiredState})
-		return func
+		return _storeIntent(func, intent, requiredState)
 
 
 	return wrapper
@@ -91,11 +97,12 @@ def _exceptHandler(*args, text: str, exceptHandler: Optional[Callable], returnTe
 	if exceptHandler:
 		return exceptHandler(*args, **kwargs)
 
+	superManager = SuperManager.getInstance()
 	caller = args[0] if args else None
 	skill = getattr(caller, 'name', 'system')
-	newText = SuperManager.getInstance().TalkManager.randomTalk(text, skill=skill)
+	newText = superManager.TalkManager.randomTalk(text, skill=skill)
 	if not newText:
-		newText = SuperManager.getInstance().TalkManager.randomTalk(text, skill='system') or text
+		newText = superManager.TalkManager.randomTalk(text, skill='system') or text
 
 	if not newText:
 		raise Exception('String **text** not found in either skill or system strings')
@@ -105,10 +112,10 @@ def _exceptHandler(*args, text: str, exceptHandler: Optional[Callable], returnTe
 
 	session = kwargs.get('session')
 	try:
-		if session.sessionId in SuperManager.getInstance().DialogManager.sessions:
-			SuperManager.getInstance().MqttManager.endDialog(sessionId=session.sessionId, text=newText)
+		if session.sessionId in superManager.DialogManager.sessions:
+			superManager.MqttManager.endDialog(sessionId=session.sessionId, text=newText)
 		else:
-			SuperManager.getInstance().MqttManager.say(text=newText, deviceUid=session.deviceUid)
+			superManager.MqttManager.say(text=newText, deviceUid=session.deviceUid)
 	except AttributeError:
 		return newText
 
@@ -221,7 +228,8 @@ def KnownUser(func: Callable = None):  # NOSONAR
 			if session and session.user != constants.UNKNOWN_USER:
 				return func(*args, **kwargs)
 
-			SuperManager.getInstance().MqttManager.endDialog(sessionId=session.sessionId, text=SuperManager.getInstance().TalkManager.randomTalk('unknownUser', skill='system'))
+			superManager = SuperManager.getInstance()
+			superManager.MqttManager.endDialog(sessionId=session.sessionId, text=superManager.TalkManager.randomTalk('unknownUser', skill='system'))
 
 
 		return decorator
@@ -246,6 +254,15 @@ def IfSetting(func: Callable = None, settingName: str = None, settingValue: Any
 	"""
 
 
+	# The setting to read is known at decoration time, only its value has to be fetched per call
+	if skillName:
+		def getSetting():
+			return SuperManager.getInstance().ConfigManager.getSkillConfigByName(skillName, settingName)
+	else:
+		def getSetting():
+			return SuperManager.getInstance().ConfigManager.getAliceConfigByName(settingName)
+
+
 	# noinspection PyShadowingNames
 	def argumentWrapper(func: Callable):
 		@functools.wraps(func)
@@ -254,8 +271,7 @@ def IfSetting(func: Callable = None, settingName: str = None, settingValue: Any
 				Logger().logWarning(msg='Cannot use IfSetting decorator without settingName')
 				return None
 
-			configManager = SuperManager.getInstance().ConfigManager
-			value = configManager.getSkillConfigByName(skillName, settingName) if skillName else configManager.getAliceConfigByName(settingName)
+			value = getSetting()
 
 			if value is None:
 				return returnValue
@@ -19,7 +19,7 @@
 
 import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Union
 
 from core.base.model.Manager import Manager
 from core.util.model.AliceSubprocess import AliceSubprocess
@@ -61,7 +61,7 @@ class SubprocessManager(Manager):
 		return self._subproc[name].process.poll() is None
 
 
-	def runSubprocess(self, name: str, cmd: str, stoppedCallback: Callable = None, autoRestart: bool = False) -> bool:
+	def runSubprocess(self, name: str, cmd: Union[str, List[str]], stoppedCallback: Callable = None, autoRestart: bool = False) -> bool:
 		if name in self._subproc and self._subproc[name].process.poll() is None:
 			self.logError(f'Tried adding the subprocess {name} twice')
 			return False
@@ -18,12 +18,12 @@
 #  Last modified: 2021.05.24 at 12:56:46 CEST
 
 import subprocess
-from typing import Callable
+from typing import Callable, List, Union
 
 
 class AliceSubprocess(object):
 
-	def __init__(self, name: str, cmd: str, stoppedCallback: Callable, autoRestart: bool):
+	def __init__(self, name: str, cmd: Union[str, List[str]], stoppedCallback: Callable, autoRestart: bool):
 		self.name = name
 		self.cmd = cmd
 		self.stoppedCallback = stoppedCallback
@@ -32,4 +32,5 @@ class AliceSubprocess(object):
 
 
 	def start(self):
-		self.process = subprocess.Popen(self.cmd.split(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+		args = self.cmd if isinstance(self.cmd, list) else self.cmd.split()
+		self.process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
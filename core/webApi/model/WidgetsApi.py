@@ -35,7 +35,8 @@ class WidgetsApi(Api):
 	@route('/', methods=['GET'])
 	def getWidgets(self):
 		try:
-			widgets = {widget.id: widget.toDict(self.UserManager.apiTokenValid(request.headers.get('auth', ''))) for widget in self.WidgetManager.widgets.values()}
+			isAuth = self.UserManager.apiTokenValid(request.headers.get('auth', ''))
+			widgets = {widget.id: widget.toDict(isAuth) for widget in self.WidgetManager.widgets.values()}
 			return jsonify(success=True, widgets=widgets)
 
 		except Exception as e:
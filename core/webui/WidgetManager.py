@@ -301,13 +301,8 @@ class WidgetManager(Manager):
 
 
 	def getNextZIndex(self, pageId: int):
-		# Build a list of widgets on this page
-		widgets = list()
-		for widget in self._widgets.values():
-			if widget.page == pageId:
-				widgets.insert(widget.z, widget)
-
-		return len(widgets) + 1
+		# One above the number of widgets on this page
+		return sum(1 for widget in self._widgets.values() if widget.page == pageId) + 1
 
 
 	def saveWidgetPosition(self, widgetId: int, x: int, y: int) -> bool:  # NOSONAR
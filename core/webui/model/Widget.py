@@ -17,24 +17,112 @@
 #
 #  Last modified: 2021.04.13 at 12:56:49 CEST
 
-import htmlmin as htmlmin
+import functools
 import inspect
 import json
 import re
 import sqlite3
-from cssmin import cssmin
-from jsmin import jsmin
 from pathlib import Path
-from typing import Dict, Match, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from core.base.model.AliceSkill import AliceSkill
 from core.base.model.ProjectAliceObject import ProjectAliceObject
 from core.webui.model.WidgetSizes import WidgetSizes
 
 
+@functools.lru_cache(maxsize=None)
+def htmlMinifier() -> Callable[[str], str]:
+	"""
+	Minifiers are only imported once a widget template has to be rendered
+	:return: the html minifying function
+	"""
+	import htmlmin
+	return functools.partial(htmlmin.minify,
+	                         remove_comments=True,
+	                         remove_empty_space=True,
+	                         remove_all_empty_space=True,
+	                         reduce_empty_attributes=True,
+	                         reduce_boolean_attributes=True,
+	                         remove_optional_attribute_quotes=False,
+	                         convert_charrefs=True,
+	                         keep_pre=False
+	                         )
+
+
+LANG_REGEX = re.compile(r'{{ lang\.(\w*) }}')
+
+
+def renderWidgetTemplate(content: str, strings: Dict[str, str]) -> Tuple[str, str]:
+	"""
+	Renders a raw widget template, without any file or manager access
+	:param content: the template source
+	:param strings: the widget language strings for the active language
+	:return: tuple of icon and minified html
+	"""
+	# Cut the icon out of the template in a single scan
+	icon = ''
+	start = content.find('<icon>')
+	end = content.find('</icon>', start) if start != -1 else -1
+	if end != -1:
+		icon = ' '.join(content[start + len('<icon>'):end].split())
+		content = content[:start] + content[end + len('</icon>'):]
+
+	content = LANG_REGEX.sub(lambda match: strings.get(match.group(1), 'Missing string'), content)
+
+	# Unwrap everything from the first <widget> to the last </widget>
+	start = content.find('<widget>')
+	end = content.rfind('</widget>')
+	if start != -1 and end >= start + len('<widget>'):
+		content = content[:start] + content[start + len('<widget>'):end] + content[end + len('</widget>'):]
+
+	return icon, htmlMinifier()(content)
+
+
+def settingsProperty(key: str, *default: Any) -> property:
+	"""
+	Builds a property reading and writing a single widget setting
+	:param key: the settings key
+	:param default: optional value returned if the setting is missing, raises KeyError if not given
+	:return: property
+	"""
+	if default:
+		def getter(self) -> Any:
+			return self._settings.get(key, default[0])
+	else:
+		def getter(self) -> Any:
+			return self._settings[key]
+
+	def setter(self, value: Any):
+		self._settings[key] = value
+
+	return property(getter, setter)
+
+
 class Widget(ProjectAliceObject):
+	# ProjectAliceObject keeps its __dict__, but the widget's own state lives in slots
+	__slots__ = ('_id', '_skill', '_name', '_settings', '_configs', '_page', '_lang', '_langVersion', '_skillInstance')
+
 	DEFAULT_SIZE = WidgetSizes.w_small
 	DEFAULT_OPTIONS = dict()
+	DEFAULT_SETTINGS = {
+		'x'                 : 0,
+		'y'                 : 0,
+		'r'                 : 0,
+		'background'        : '#636363',
+		'background-opacity': 1,
+		'color'             : '#d1d1d1',
+		'font-size'         : 1,
+		'rgba'              : 'rgba(99, 99, 99, 1)',
+		'title'             : True,
+		'borders'           : True
+	}
+
+	# noinspection SqlResolve
+	SAVE_QUERY = 'REPLACE INTO :__table__ (id, skill, name, settings, configs, page) VALUES (:id, :skill, :name, :settings, :configs, :page)'
+
+
+	# Rendered templates, css and js, keyed by source file and kept as long as the file isn't modified
+	_RENDER_CACHE: Dict[Tuple, Tuple[int, Any]] = dict()
 
 
 	def __init__(self, data: Union[sqlite3.Row, dict]):
@@ -49,28 +137,18 @@ class Widget(ProjectAliceObject):
 		self._settings = json.loads(data['settings'])
 		self._configs = json.loads(data['configs'])
 		self._page = data['page']
+		self._langVersion: Optional[int] = None
 		self._lang = self.loadLanguageFile()
-		self._skillInstance: AliceSkill = self.SkillManager.getSkillInstance(skillName=self._skill)
+		self._skillInstance: Optional[AliceSkill] = None
 
 		if not self._configs:
 			self._configs = self.DEFAULT_OPTIONS.copy()
 
 		if not self._settings:
-			self._settings = {
-				'x'                 : 0,
-				'y'                 : 0,
-				'z'                 : self.WidgetManager.getNextZIndex(self._page),
-				'w'                 : int(self.DEFAULT_SIZE.value.split('x')[0]),
-				'h'                 : int(self.DEFAULT_SIZE.value.split('x')[1]),
-				'r'                 : 0,
-				'background'        : '#636363',
-				'background-opacity': 1,
-				'color'             : '#d1d1d1',
-				'font-size'         : 1,
-				'rgba'              : 'rgba(99, 99, 99, 1)',
-				'title'             : True,
-				'borders'           : True
-			}
+			self._settings = self.DEFAULT_SETTINGS.copy()
+			self._settings['z'] = self.WidgetManager.getNextZIndex(self._page)
+			self._settings['w'] = self.DEFAULT_SIZE.width
+			self._settings['h'] = self.DEFAULT_SIZE.height
 
 		if self._id == -1:
 			self.saveToDB()
@@ -86,9 +164,10 @@ class Widget(ProjectAliceObject):
 
 	def loadLanguageFile(self) -> Optional[Dict]:
 		try:
+			# Shared by every instance of the widget, reloaded only if the file changes
 			ffile = self.getCurrentDir() / f'lang/{self.name}.lang.json'
-			with ffile.open() as fp:
-				return json.load(fp)
+			self._langVersion = ffile.stat().st_mtime_ns
+			return self._cachedRender(ffile, json.loads)
 		except FileNotFoundError:
 			self.logWarning(f'Missing language file for widget {self.name}')
 			return None
@@ -97,99 +176,134 @@ class Widget(ProjectAliceObject):
 			return None
 
 
-	# noinspection SqlResolve
+	def dbValues(self) -> dict:
+		return {
+			'id'      : self._id if self._id != 9999 else '',
+			'skill'   : self._skill,
+			'name'    : self._name,
+			'settings': json.dumps(self._settings),
+			'configs' : json.dumps(self._configs),
+			'page'    : self._page
+		}
+
+
 	def saveToDB(self):
 		if self._id != -1:
 			self.DatabaseManager.replace(
 				tableName=self.WidgetManager.WIDGETS_TABLE,
-				query='REPLACE INTO :__table__ (id, skill, name, settings, configs, page) VALUES (:id, :skill, :name, :settings, :configs, :page)',
+				query=self.SAVE_QUERY,
 				callerName=self.WidgetManager.name,
-				values={
-					'id'      : self._id if self._id != 9999 else '',
-					'skill'   : self._skill,
-					'name'    : self._name,
-					'settings': json.dumps(self._settings),
-					'configs' : json.dumps(self._configs),
-					'page'    : self._page
-				}
+				values=self.dbValues()
 			)
 		else:
+			values = self.dbValues()
+			values.pop('id')
 			widgetId = self.DatabaseManager.insert(
 				tableName=self.WidgetManager.WIDGETS_TABLE,
 				callerName=self.WidgetManager.name,
-				values={
-					'skill'   : self._skill,
-					'name'    : self._name,
-					'settings': json.dumps(self._settings),
-					'configs' : json.dumps(self._configs),
-					'page'    : self._page
-				}
+				values=values
 			)
 
 			self._setId(widgetId)
 
 
 	def getCurrentDir(self) -> Path:
-		return Path(inspect.getfile(self.__class__)).parent
+		return self._classDir()
 
 
-	def icon(self) -> str:
-		try:
-			ffile = Path(self.getCurrentDir(), f'templates/{self.name}.html')
-			content = cssmin(ffile.read_text())
-			header = re.search(r'<icon>(.*)</icon>', content)
-			if header:
-				return header.group(1)
+	@classmethod
+	@functools.lru_cache(maxsize=None)
+	def _classDir(cls) -> Path:
+		return Path(inspect.getfile(cls)).parent
+
 
-			return ''
-		except:
-			self.logWarning("Widget doesn't have any icon")
-			return ''
+	def _cachedRender(self, ffile: Path, render: Callable[[str], Any], *key) -> Any:
+		"""
+		Returns the rendered content of the given file, only rendering it again if the file changed
+		:param ffile: the source file
+		:param render: callable turning the file content into the rendered result
+		:param key: anything else the rendered result depends on
+		:return: the rendered result
+		"""
+		mtime = ffile.stat().st_mtime_ns
+		cacheKey = (ffile, *key)
+		cached = self._RENDER_CACHE.get(cacheKey)
+		if cached and cached[0] == mtime:
+			return cached[1]
 
+		rendered = render(ffile.read_bytes().decode('utf-8'))
+		self._RENDER_CACHE[cacheKey] = (mtime, rendered)
+		return rendered
 
-	def html(self) -> str:
+
+	def renderTemplate(self) -> Tuple[str, str]:
+		"""
+		Renders the widget template once for both the icon and the html
+		:return: tuple of icon and html
+		"""
 		try:
 			ffile = Path(self.getCurrentDir(), f'templates/{self.name}.html')
-			content = ffile.read_text()
-			content = re.sub(r'{{ lang\.(\w*) }}', self.langReplace, content)
-			content = re.sub(r'<widget>(.*)</widget>', r'\1', content, flags=re.S)
-			content = re.sub(r'<icon>.*</icon>(.*)', r'\1', content)
-			content = htmlmin.minify(content,
-			                         remove_comments=True,
-			                         remove_empty_space=True,
-			                         remove_all_empty_space=True,
-			                         reduce_empty_attributes=True,
-			                         reduce_boolean_attributes=True,
-			                         remove_optional_attribute_quotes=False,
-			                         convert_charrefs=True,
-			                         keep_pre=False
-			                         )
-			return content
-		except:
+			# The rendered html embeds the language strings, so it depends on the loaded language file too
+			return self._cachedRender(ffile, self._renderTemplate, self.LanguageManager.activeLanguage, self._langVersion)
+		except FileNotFoundError:
 			self.logWarning("Widget doesn't have html file")
-			return ''
+		except (OSError, UnicodeDecodeError) as e:
+			self.logWarning(f"Couldn't read widget html file: {e}")
+		except Exception as e:
+			self.logWarning(f'Failed rendering widget html: {e}')
+		return '', ''
+
+
+	def _renderTemplate(self, content: str) -> Tuple[str, str]:
+		strings = self._lang.get(self.LanguageManager.activeLanguage, dict()) if self._lang else dict()
+		return renderWidgetTemplate(content, strings)
+
+
+	def renderAll(self) -> Tuple[str, str, str]:
+		"""
+		Renders everything the interface needs to display the widget
+		:return: tuple of icon, html and css
+		"""
+		icon, html = self.renderTemplate()
+		return icon, html, self.css()
+
+
+	def icon(self) -> str:
+		return self.renderTemplate()[0]
+
+
+	def html(self) -> str:
+		return self.renderTemplate()[1]
 
 
 	def css(self) -> str:
+		from cssmin import cssmin
+
 		try:
 			ffile = Path(self.getCurrentDir(), f'css/{self.name}.css')
-			content = cssmin(ffile.read_text())
-			return content
-		except:
-			return ''
+			return self._cachedRender(ffile, cssmin)
+		except FileNotFoundError:
+			pass
+		except (OSError, UnicodeDecodeError) as e:
+			self.logWarning(f"Couldn't read widget css file: {e}")
+		except Exception as e:
+			self.logWarning(f'Failed minifying widget css: {e}')
+		return ''
 
 
 	def js(self) -> str:
+		from jsmin import jsmin
+
 		try:
 			ffile = Path(self.getCurrentDir(), f'js/{self.name}.js')
-			content = jsmin(ffile.read_text())
-			return content
-		except:
-			return ''
-
-
-	def langReplace(self, match: Match):
-		return self.getLanguageString(match.group(1))
+			return self._cachedRender(ffile, jsmin)
+		except FileNotFoundError:
+			pass
+		except (OSError, UnicodeDecodeError) as e:
+			self.logWarning(f"Couldn't read widget js file: {e}")
+		except Exception as e:
+			self.logWarning(f'Failed minifying widget js: {e}')
+		return ''
 
 
 	def getLanguageString(self, key: str) -> str:
@@ -204,54 +318,11 @@ class Widget(ProjectAliceObject):
 		return self._id
 
 
-	@property
-	def x(self) -> int:  # NOSONAR
-		return self._settings.get('x', 0)
-
-
-	@x.setter
-	def x(self, value: int):  # NOSONAR
-		self._settings['x'] = value
-
-
-	@property
-	def y(self) -> int:  # NOSONAR
-		return self._settings.get('y', 0)
-
-
-	@y.setter
-	def y(self, value: int):  # NOSONAR
-		self._settings['y'] = value
-
-
-	@property
-	def z(self) -> int:  # NOSONAR
-		return self._settings.get('z', 0)
-
-
-	@z.setter
-	def z(self, value: int):  # NOSONAR
-		self._settings['z'] = value
-
-
-	@property
-	def w(self) -> int:  # NOSONAR
-		return self._settings['w']
-
-
-	@w.setter
-	def w(self, w: int):  # NOSONAR
-		self._settings['w'] = w
-
-
-	@property
-	def h(self) -> int:  # NOSONAR
-		return self._settings['h']
-
-
-	@h.setter
-	def h(self, h: int):  # NOSONAR
-		self._settings['h'] = h
+	x = settingsProperty('x', 0)
+	y = settingsProperty('y', 0)
+	z = settingsProperty('z', 0)
+	w = settingsProperty('w')
+	h = settingsProperty('h')
 
 
 	@property
@@ -306,10 +377,14 @@ class Widget(ProjectAliceObject):
 
 	@property
 	def skillInstance(self) -> AliceSkill:
+		# Resolved on first use, so widgets don't depend on the skills being loaded when they are created
+		if not self._skillInstance:
+			self._skillInstance = self.SkillManager.getSkillInstance(skillName=self._skill)
 		return self._skillInstance
 
 
 	def toDict(self, isAuth: bool = False) -> dict:
+		icon, html, css = self.renderAll()
 		return {
 			'id'            : self._id,
 			'skill'         : self._skill,
@@ -318,7 +393,7 @@ class Widget(ProjectAliceObject):
 			'configs'       : self._configs if isAuth else dict(),
 			'configTemplate': self.skillInstance.getWidgetTemplate(self._name),
 			'page'          : self._page,
-			'icon'          : self.icon(),
-			'html'          : self.html(),
-			'css'           : self.css()
+			'icon'          : icon,
+			'html'          : html,
+			'css'           : css
 		}
@@ -36,3 +36,10 @@ class WidgetSizes(Enum):
 	w_extralarge = '500x500'
 	w_extralarge_wide = '700x500'
 	w_extralarge_tall = '500x700'
+
+
+	def __init__(self, size: str):
+		# Parsed once, widgets read their default dimensions from these
+		width, height = size.split('x')
+		self.width = int(width)
+		self.height = int(height)
@@ -0,0 +1,108 @@
+#  Copyright (c) 2021
+#
+#  This file, test_Asr.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2021.04.13 at 12:56:50 CEST
+
+import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+
+from core.asr.model.CoquiAsr import CoquiAsr
+
+
+class FakeRecorder(object):
+
+	def __init__(self, chunks: list):
+		self._chunks = chunks
+		self.pendingChunks = 0
+
+
+	def __enter__(self):
+		return self
+
+
+	def __exit__(self, excType, excVal, excTb):
+		pass
+
+
+	def stopRecording(self):
+		pass
+
+
+	def __iter__(self):
+		for chunk, pending in self._chunks:
+			self.pendingChunks = pending
+			yield chunk
+
+
+class TestCoquiAsr(unittest.TestCase):
+
+	def setUp(self):
+		self._config = {'asrTimeout': 10, 'asrPartialDecodeInterval': 2}
+		superManager = mock.patch('core.base.SuperManager.SuperManager').start().getInstance.return_value
+		superManager.CommonsManager.rootDir.return_value = '/tmp'
+		superManager.ConfigManager.getAliceConfigByName.side_effect = self._config.get
+
+		self._asr = CoquiAsr()
+		self._asr._model = MagicMock()
+		self._stream = self._asr._model.createStream.return_value
+		self._stream.intermediateDecode.side_effect = lambda: f'partial {self._stream.intermediateDecode.call_count}'
+		self._stream.finishStream.return_value = 'hello'
+
+
+	def tearDown(self):
+		mock.patch.stopall()
+
+
+	def decode(self, chunks: list):
+		with mock.patch('core.asr.model.CoquiAsr.Recorder', return_value=FakeRecorder(chunks)), \
+				mock.patch.object(self._asr, 'partialTextCaptured') as partialTextCaptured:
+			result = self._asr.decodeStream(MagicMock())
+		return result, partialTextCaptured
+
+
+	def test_decode_stream(self):
+		# every second chunk is decoded when there is no backlog
+		result, partialTextCaptured = self.decode([(b'\x01\x00', 0)] * 5 + [(b'', 0)])
+		self.assertEqual(self._stream.feedAudioContent.call_count, 5)
+		self.assertEqual(self._stream.intermediateDecode.call_count, 2)
+		self.assertEqual([call[1]['text'] for call in partialTextCaptured.call_args_list], ['partial 1', 'partial 2'])
+		self.assertEqual(result.text, 'hello')
+
+
+	def test_decode_stream_backlog(self):
+		# partials wait until the recorder backlog is consumed
+		self.decode([(b'\x01\x00', 3), (b'\x01\x00', 2), (b'\x01\x00', 1), (b'\x01\x00', 0), (b'', 0)])
+		self.assertEqual(self._stream.feedAudioContent.call_count, 4)
+		self.assertEqual(self._stream.intermediateDecode.call_count, 1)
+
+
+	def test_decode_stream_default_interval(self):
+		self._config.pop('asrPartialDecodeInterval')
+		self.decode([(b'\x01\x00', 0)] * 8)
+		self.assertEqual(self._stream.intermediateDecode.call_count, 2)
+
+
+	def test_decode_stream_nothing_heard(self):
+		self._stream.finishStream.return_value = ''
+		result, _ = self.decode([(b'', 0)])
+		self.assertIsNone(result)
+		self._stream.intermediateDecode.assert_not_called()
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -18,9 +18,27 @@
 #  Last modified: 2021.04.13 at 12:56:50 CEST
 
 import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+
+from core.asr.model.Recorder import Recorder
+
 
 class TestRecorder(unittest.TestCase):
 
+	@mock.patch('core.base.SuperManager.SuperManager')
+	def test_pending_chunks(self, _mock_superManager):
+		recorder = Recorder(MagicMock(), 'user', 'deviceUid')
+		self.assertEqual(recorder.pendingChunks, 0)
+
+		recorder.startRecording()
+		recorder.stopRecording()
+		self.assertEqual(recorder.pendingChunks, 1)
+
+		list(recorder)
+		self.assertEqual(recorder.pendingChunks, 0)
+
+
 	def test_is_recording(self):
 		pass # Nothing to test
 
@@ -17,25 +17,207 @@
 #
 #  Last modified: 2021.04.13 at 12:56:50 CEST
 
-from unittest import TestCase
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+from core.webui.model.Widget import Widget, renderWidgetTemplate
+
+
+TEMPLATE = '''<icon>fas fa-clock</icon>
+<widget>
+	<div class="clock">
+		<span>{{ lang.time }}</span>
+		<span>{{ lang.unknown }}</span>
+	</div>
+</widget>
+'''
+
+
+class WidgetTest(Widget):
+	pass
 
 
 class TestWidget(TestCase):
 
+	def setUp(self):
+		self._tmp = tempfile.TemporaryDirectory()
+		self._dir = Path(self._tmp.name)
+		for folder in ('templates', 'css', 'js', 'lang'):
+			(self._dir / folder).mkdir()
+
+		(self._dir / 'templates/WidgetTest.html').write_text(TEMPLATE)
+		(self._dir / 'css/WidgetTest.css').write_text('.clock {\n\tcolor: red;\n}\n')
+		(self._dir / 'js/WidgetTest.js').write_text('function tick() {\n\treturn 1;\n}\n')
+		(self._dir / 'lang/WidgetTest.lang.json').write_text(json.dumps({'en': {'time': 'Time'}}))
+
+		self._superManager = mock.patch('core.base.SuperManager.SuperManager').start()
+		self._instance = MagicMock()
+		self._superManager.getInstance.return_value = self._instance
+		self._instance.LanguageManager.activeLanguage = 'en'
+		self._instance.Commons.dictFromRow = dict
+
+		mock.patch.object(WidgetTest, 'getCurrentDir', return_value=self._dir).start()
+
+
+	def tearDown(self):
+		mock.patch.stopall()
+		self._tmp.cleanup()
+
+
+	@staticmethod
+	def makeWidget() -> WidgetTest:
+		return WidgetTest({
+			'id'      : 1,
+			'skill'   : 'TestSkill',
+			'name'    : 'WidgetTest',
+			'settings': json.dumps({'x': 10, 'y': 20, 'z': 1, 'w': 100, 'h': 100}),
+			'configs' : '{}',
+			'page'    : 1
+		})
+
+
+	def test_render_template(self):
+		widget = self.makeWidget()
+		icon, html = widget.renderTemplate()
+		self.assertEqual(icon, 'fas fa-clock')
+		self.assertIn('<span>Time</span><span>Missing string</span>', html)
+		self.assertNotIn('widget>', html)
+		self.assertNotIn('icon>', html)
+		self.assertEqual(widget.icon(), icon)
+		self.assertEqual(widget.html(), html)
+
+
+	def test_render_widget_template(self):
+		icon, html = renderWidgetTemplate('<icon>fas fa-bell</icon>before<widget><b>{{ lang.hi }}</b></widget>after', {'hi': 'Hello'})
+		self.assertEqual(icon, 'fas fa-bell')
+		self.assertEqual(html, 'before<b>Hello</b>after')
+		self.assertEqual(renderWidgetTemplate('<p>{{ lang.hi }}</p>', dict()), ('', '<p>Missing string</p>'))
+
+		# attribute quotes and inline scripts are left alone
+		script = '<script>let x = 1; console.log(x)</script>'
+		self.assertEqual(renderWidgetTemplate(f'<p class="a" onclick="refresh(this)">a</p>{script}', dict())[1], f'<p class="a" onclick="refresh(this)">a</p>{script}')
+
+
+	def test_render_cache(self):
+		widget = self.makeWidget()
+		template = self._dir / 'templates/WidgetTest.html'
+		first = widget.renderTemplate()
+
+		# unchanged files are not read again
+		with mock.patch.object(Path, 'read_bytes', side_effect=AssertionError):
+			self.assertEqual(widget.renderTemplate(), first)
+
+		# modified files are rendered again
+		template.write_text(TEMPLATE.replace('fa-clock', 'fa-bell'))
+		newTime = template.stat().st_mtime_ns + 1_000_000_000
+		os.utime(template, ns=(newTime, newTime))
+		self.assertEqual(widget.icon(), 'fas fa-bell')
+
+
+	def test_render_cache_language(self):
+		widget = self.makeWidget()
+		self.assertIn('<span>Time</span>', widget.html())
+
+		langFile = self._dir / 'lang/WidgetTest.lang.json'
+		langFile.write_text(json.dumps({'en': {'time': 'Clock'}}))
+		newTime = langFile.stat().st_mtime_ns + 1_000_000_000
+		os.utime(langFile, ns=(newTime, newTime))
+
+		self.assertIn('<span>Clock</span>', self.makeWidget().html())
+		# instances still holding the previous strings keep rendering them
+		self.assertIn('<span>Time</span>', widget.html())
+
+
+	def test_css_js(self):
+		widget = self.makeWidget()
+		self.assertEqual(widget.css(), '.clock{color:red}')
+		self.assertEqual(widget.js(), 'function tick(){return 1;}')
+
+		(self._dir / 'css/WidgetTest.css').unlink()
+		self.assertEqual(widget.css(), '')
+
+
+	def test_missing_template(self):
+		widget = self.makeWidget()
+		(self._dir / 'templates/WidgetTest.html').unlink()
+		self.assertEqual(widget.renderTemplate(), ('', ''))
+		(self._dir / 'js/WidgetTest.js').unlink()
+		self.assertEqual(widget.js(), '')
+
+
+	def test_unreadable_files(self):
+		widget = self.makeWidget()
+		(self._dir / 'css/WidgetTest.css').write_bytes(b'.clock{\xff}')
+		with mock.patch.object(widget, 'logWarning') as logWarning:
+			self.assertEqual(widget.css(), '')
+			logWarning.assert_called_once()
+
+
+	def test_to_dict(self):
+		widget = self.makeWidget()
+		data = widget.toDict()
+		self.assertEqual(data['icon'], 'fas fa-clock')
+		self.assertEqual(data['css'], '.clock{color:red}')
+		self.assertEqual(data['settings']['x'], 10)
+		self.assertEqual(data['configs'], dict())
+		self.assertEqual(widget.toDict(isAuth=True)['configs'], dict())
+
+
+	def test_default_settings(self):
+		self._instance.WidgetManager.getNextZIndex.return_value = 3
+		widget = WidgetTest({'id': 2, 'skill': 'TestSkill', 'name': 'WidgetTest', 'settings': '{}', 'configs': '{}', 'page': 1})
+		self.assertEqual((widget.x, widget.z, widget.w, widget.h), (0, 3, 100, 100))
+		self.assertEqual(widget.settings['background'], '#636363')
+
+		widget.settings['background'] = '#000000'
+		self.assertEqual(Widget.DEFAULT_SETTINGS['background'], '#636363')
+		self.assertNotIn('z', Widget.DEFAULT_SETTINGS)
+
+
+	def test_slots(self):
+		widget = self.makeWidget()
+		self.assertEqual(widget.x, 10)
+		self.assertFalse(set(Widget.__slots__) & set(vars(widget)))
+
+
 	def test_set_parent_skill_instance(self):
 		pass  # To be implemented or nothing to test
 
 
 	def test_load_language(self):
-		pass  # To be implemented or nothing to test
+		widget = self.makeWidget()
+		self.assertEqual(widget.loadLanguageFile(), {'en': {'time': 'Time'}})
+
+		with mock.patch.object(Path, 'read_bytes', side_effect=AssertionError('Language file read twice')):
+			self.assertIs(self.makeWidget().loadLanguageFile(), widget.loadLanguageFile())
+
+		(self._dir / 'lang/WidgetTest.lang.json').unlink()
+		self.assertIsNone(widget.loadLanguageFile())
 
 
 	def test_save_to_db(self):
-		pass  # To be implemented or nothing to test
+		widget = self.makeWidget()
+		widget.x = 15
+		widget.saveToDB()
+
+		values = self._instance.DatabaseManager.replace.call_args[1]['values']
+		self.assertEqual(values['id'], 1)
+		self.assertEqual(json.loads(values['settings']), {'x': 15, 'y': 20, 'z': 1, 'w': 100, 'h': 100})
+		self.assertEqual(json.loads(values['configs']), dict())
+
+		# non string keys are converted, like they always were
+		widget._configs = {1: 'one'}
+		widget.saveToDB()
+		self.assertEqual(json.loads(self._instance.DatabaseManager.replace.call_args[1]['values']['configs']), {'1': 'one'})
 
 
 	def test_get_current_dir(self):
-		pass  # To be implemented or nothing to test
+		self.assertEqual(WidgetTest._classDir(), Path(__file__).parent)
+		self.assertIs(WidgetTest._classDir(), WidgetTest._classDir())
 
 
 	def test_html(self):
@@ -79,7 +261,16 @@ class TestWidget(TestCase):
 
 
 	def test_x(self):
-		pass  # To be implemented or nothing to test
+		widget = self.makeWidget()
+		widget.x = 42
+		widget.w = 300
+		self.assertEqual((widget.x, widget.y, widget.w, widget.h), (42, 20, 300, 100))
+		self.assertEqual(widget.settings['x'], 42)
+
+		del widget.settings['x'], widget.settings['w']
+		self.assertEqual(widget.x, 0)
+		with self.assertRaises(KeyError):
+			_ = widget.w
 
 
 	def test_y(self):
@@ -151,4 +342,12 @@ class TestWidget(TestCase):
 
 
 	def test_skill_instance(self):
-		pass  # To be implemented or nothing to test
+		getSkillInstance = self._instance.SkillManager.getSkillInstance
+		getSkillInstance.reset_mock()
+
+		widget = self.makeWidget()
+		getSkillInstance.assert_not_called()
+
+		self.assertIs(widget.skillInstance, getSkillInstance.return_value)
+		self.assertIs(widget.skillInstance, getSkillInstance.return_value)
+		getSkillInstance.assert_called_once_with(skillName='TestSkill')
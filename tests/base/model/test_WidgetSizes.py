@@ -19,6 +19,15 @@
 
 from unittest import TestCase
 
+from core.webui.model.WidgetSizes import WidgetSizes
+
 
 class TestWidgetSizes(TestCase):
-	pass
+
+	def test_dimensions(self):
+		self.assertEqual(WidgetSizes.w_small_wide.width, 200)
+		self.assertEqual(WidgetSizes.w_small_wide.height, 100)
+		self.assertEqual(WidgetSizes.w.width, 200)
+		self.assertEqual(WidgetSizes('500x700'), WidgetSizes.w_extralarge_tall)
+		for size in WidgetSizes:
+			self.assertEqual(size.value, f'{size.width}x{size.height}')
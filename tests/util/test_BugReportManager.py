@@ -0,0 +1,64 @@
+#  Copyright (c) 2021
+#
+#  This file, test_BugReportManager.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2021.04.13 at 12:56:52 CEST
+
+import unittest
+from unittest import mock
+
+from core.util.BugReportManager import BugReportManager
+
+
+class TestBugReportManager(unittest.TestCase):
+
+	def test_splitHistory(self):
+		# lines are kept together as long as they fit
+		self.assertEqual(list(BugReportManager.splitHistory(['aaa', 'bbb', 'ccc'], 7)), ['aaa\nbbb', 'ccc'])
+
+		# no text is ever longer than the max length
+		for text in BugReportManager.splitHistory(['ab'] * 100, 20):
+			self.assertLessEqual(len(text), 20)
+
+		# lines that are too long on their own are cut
+		self.assertEqual(list(BugReportManager.splitHistory(['x' * 10], 7)), ['xxxxxxx'])
+
+		# an empty history still makes one, empty, text
+		self.assertEqual(list(BugReportManager.splitHistory([], 7)), [''])
+
+
+	@mock.patch('core.base.SuperManager.SuperManager')
+	def test_reportLines(self, _mock_superManager):
+		with mock.patch.object(BugReportManager, 'HISTORY_TAIL_LENGTH', 3):
+			bugReportManager = BugReportManager()
+		bugReportManager._recording = True
+		bugReportManager.ERROR_CONTEXT_LINES = 1
+
+		bugReportManager.addToHistory('info', 'Git commit id: abc')
+		try:
+			raise ValueError('broken')
+		except ValueError:
+			bugReportManager.addToHistory('error', 'Something broke')
+
+		for i in range(6):
+			bugReportManager.addToHistory('info', f'line {i}')
+
+		self.assertEqual(bugReportManager._title, 'ValueError: broken')
+		self.assertEqual(list(bugReportManager.reportLines()), ['Git commit id: abc', 'Something broke', 'line 0', '[...] 2 lines dropped', 'line 3', 'line 4', 'line 5'])
+
+
+if __name__ == "__main__":
+	unittest.main()
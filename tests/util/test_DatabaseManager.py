@@ -17,7 +17,10 @@
 #
 #  Last modified: 2021.04.13 at 12:56:52 CEST
 
-from unittest import TestCase
+from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+from core.util.DatabaseManager import DatabaseManager
 
 
 class TestDatabaseManager(TestCase):
@@ -70,5 +73,15 @@ class TestDatabaseManager(TestCase):
 		pass  # To be implemented or nothing to test()
 
 
-	def test_basic_checks(self):
-		pass  # To be implemented or nothing to test()
+	@mock.patch('core.base.SuperManager.SuperManager')
+	def test_basic_checks(self, mock_superManager):
+		mock_superManager.getInstance.return_value = MagicMock()
+		databaseManager = DatabaseManager()
+		query = 'SELECT * FROM :__table__ WHERE id = :id'
+
+		self.assertEqual(databaseManager.basicChecks('rows', query, 'Test', {'id': 1}), 'SELECT * FROM Test_rows WHERE id = :id')
+		self.assertEqual(databaseManager.basicChecks('rows', query, 'Test', {'id': 2}), 'SELECT * FROM Test_rows WHERE id = :id')
+		self.assertEqual(databaseManager.basicChecks('others', query, 'Test'), 'SELECT * FROM Test_others WHERE id = :id')
+		self.assertIsNone(databaseManager.basicChecks('rows', query, 'Test', {':__table__': 1}))
+		self.assertIsNone(databaseManager.basicChecks('rows', 'SELECT * FROM rows', 'Test'))
+		self.assertIsNone(databaseManager.basicChecks('sqlite_master', query, 'Test'))
@@ -20,9 +20,10 @@
 from unittest import mock
 
 import unittest
+import warnings
 from unittest.mock import MagicMock
 
-from core.util.Decorators import AnyExcept, IntentHandler, Online, deprecated
+from core.util.Decorators import AnyExcept, IfSetting, IntentHandler, Online, deprecated
 
 
 class TestDecorators(unittest.TestCase):
@@ -36,6 +37,12 @@ class TestDecorators(unittest.TestCase):
 			f'Call to deprecated function {legacy_function.__name__}.',
 			legacy_function)
 
+		# the warning is only emitted on first use
+		with warnings.catch_warnings(record=True) as caught:
+			warnings.simplefilter('always')
+			legacy_function()
+		self.assertEqual(caught, [])
+
 
 	@mock.patch('core.util.Decorators.SuperManager')
 	def test_online(self, mock_superManager):
@@ -256,6 +263,53 @@ class TestDecorators(unittest.TestCase):
 
 
 
+	@mock.patch('core.util.Decorators.SuperManager')
+	def test_ifSetting(self, mock_superManager):
+		class AliceSkill(object):
+			@IfSetting(settingName='aliceSetting', settingValue=True)
+			def alice_setting(self):
+				return 'called'
+
+			@IfSetting(settingName='skillSetting', settingValue='value', skillName='AliceSkill', returnValue='skipped')
+			def skill_setting(self):
+				return 'called'
+
+			@IfSetting(settingName='aliceSetting', settingValue=True, inverted=True)
+			def inverted_setting(self):
+				return 'called'
+
+		exampleObject = AliceSkill()
+
+		mock_instance = MagicMock()
+		mock_superManager.getInstance.return_value = mock_instance
+		configManager = mock_instance.ConfigManager
+
+		# system settings are read from alice configs
+		configManager.getAliceConfigByName.return_value = True
+		self.assertEqual(exampleObject.alice_setting(), 'called')
+		self.assertIsNone(exampleObject.inverted_setting())
+		configManager.getAliceConfigByName.assert_called_with('aliceSetting')
+		configManager.getSkillConfigByName.assert_not_called()
+
+		configManager.getAliceConfigByName.return_value = False
+		self.assertIsNone(exampleObject.alice_setting())
+		self.assertEqual(exampleObject.inverted_setting(), 'called')
+
+		# skill settings are read from the skill configs
+		configManager.reset_mock()
+		configManager.getSkillConfigByName.return_value = 'value'
+		self.assertEqual(exampleObject.skill_setting(), 'called')
+		configManager.getSkillConfigByName.assert_called_once_with('AliceSkill', 'skillSetting')
+		configManager.getAliceConfigByName.assert_not_called()
+
+		configManager.getSkillConfigByName.return_value = 'other'
+		self.assertEqual(exampleObject.skill_setting(), 'skipped')
+
+		# unknown settings return the return value
+		configManager.getSkillConfigByName.return_value = None
+		self.assertEqual(exampleObject.skill_setting(), 'skipped')
+
+
 	@mock.patch('core.util.Decorators.Intent')
 	def test_IntentHandler(self, mock_intent):
 		class Example(object):